@@ -4,7 +4,27 @@ from sqlalchemy.orm import sessionmaker
 from .config import Config
 
 
-engine = create_async_engine(Config.DATABASE_URL, echo=True)
+engine = create_async_engine(
+    Config.DATABASE_URL,
+    echo=False,
+    pool_size=20,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    query_cache_size=1200,
+    connect_args={
+        # Кэш подготовленных выражений адаптера SQLAlchemy для asyncpg; собственный
+        # `statement_cache_size` asyncpg здесь не используется, так как адаптер готовит
+        # запросы через `Connection.prepare()` без кэша драйвера.
+        "prepared_statement_cache_size": 1024,
+        "server_settings": {
+            "jit": "off",
+            "tcp_keepalives_idle": "30",
+            "tcp_keepalives_interval": "10",
+            "tcp_keepalives_count": "3",
+        }
+    },
+)
 async_session = sessionmaker(
     engine, expire_on_commit=False, class_=AsyncSession
 )
@@ -16,10 +36,12 @@ async def get_db() -> AsyncSession:
     Асинхронный генератор для получения сеанса базы данных.
 
     Этот генератор используется для создания и управления жизненным циклом сеанса базы данных.
-    Он создаёт сеанс при входе в контекст и автоматически закрывает его при выходе.
+    Он создаёт сеанс и открывает транзакцию при входе в контекст. При выходе транзакция
+    фиксируется, а при исключении откатывается, после чего сеанс закрывается.
 
     Returns:
         AsyncGenerator[AsyncSession, None]: Генератор, который возвращает объект `AsyncSession`.
     """
     async with async_session() as session:
-        yield session
+        async with session.begin():
+            yield session
@@ -0,0 +1,42 @@
+from typing import Any, Callable
+from weakref import WeakKeyDictionary
+
+from fastapi.dependencies import utils
+
+_PREDICATES = ("is_coroutine_callable", "is_gen_callable", "is_async_gen_callable")
+
+
+def _cached(predicate: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """
+    Оборачивает проверку типа вызываемого объекта кэшем, привязанным к самому объекту.
+
+    Если объект нельзя использовать как слабую ссылку (или он не хэшируется),
+    проверка выполняется без кэша.
+    """
+    cache: WeakKeyDictionary = WeakKeyDictionary()
+
+    def wrapper(call: Any) -> bool:
+        try:
+            return cache[call]
+        except KeyError:
+            result = cache[call] = predicate(call)
+            return result
+        except TypeError:
+            return predicate(call)
+
+    wrapper.__wrapped__ = predicate
+    return wrapper
+
+
+def install() -> None:
+    """
+    Кэширует результаты `inspect`-проверок зависимостей FastAPI.
+
+    `solve_dependencies` на каждый запрос заново вызывает `inspect` для каждой зависимости
+    (например, `get_db`), чтобы понять, генератор это или корутина. Результат для одного
+    и того же объекта не меняется, поэтому он вычисляется один раз.
+    """
+    for name in _PREDICATES:
+        predicate = getattr(utils, name)
+        if not hasattr(predicate, "__wrapped__"):
+            setattr(utils, name, _cached(predicate))
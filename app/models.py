@@ -1,9 +1,9 @@
 from .database import Base
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import relationship, Mapped, mapped_column
-from typing import Annotated
+from typing import Annotated, ClassVar
 
-str_256 = Annotated[str, 256, mapped_column(nullable=False)]
+str_256 = Annotated[str, mapped_column(String(256), nullable=False)]
 intpk = Annotated[int, mapped_column(primary_key=True, autoincrement=True)]
 
 
@@ -20,6 +20,7 @@ class Recipe(Base):
         ingredients (List[Ingredient]): Список ингредиентов, связанных с рецептом. Отношение `один ко многим`.
     """
     __tablename__ = 'recipes'
+    _JSON_COLS: ClassVar[tuple[str, ...]] = ('id', 'name', 'views', 'cooking_time', 'description')
 
     id: Mapped[intpk]
     name: Mapped[str_256]
@@ -27,9 +28,10 @@ class Recipe(Base):
     cooking_time: Mapped[int] = mapped_column(nullable=False)
     description: Mapped[str_256]
 
-    ingredients: Mapped['Ingredient'] = relationship(
+    ingredients: Mapped[list['Ingredient']] = relationship(
         back_populates="recipe",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise"
     )
 
     def __repr__(self):
@@ -41,8 +43,15 @@ class Recipe(Base):
     def to_json(self):
         """
         Метод для сериализации объекта в формат JSON.
+
+        Уже загруженные значения читаются напрямую из `__dict__`, незагруженные - через `getattr`.
         """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        loaded = self.__dict__
+        return {k: loaded[k] if k in loaded else getattr(self, k) for k in self._JSON_COLS}
+
+
+# Индекс под сортировку списка рецептов: просмотры по убыванию, время приготовления по возрастанию.
+Index("ix_recipes_views_cooking", Recipe.views.desc(), Recipe.cooking_time.asc())
 
 
 class Ingredient(Base):
@@ -59,13 +68,16 @@ class Ingredient(Base):
         recipe (Recipe): Объект рецепта, к которому относится ингредиент. Отношение `многие к одному`.
     """
     __tablename__ = 'ingredients'
+    _JSON_COLS: ClassVar[tuple[str, ...]] = (
+        'id', 'name', 'cooking_time', 'description', 'list_of_ingredients', 'recipe_id'
+    )
 
     id: Mapped[intpk]
     name: Mapped[str_256]
     cooking_time: Mapped[int] = mapped_column(nullable=False)
     description: Mapped[str_256]
     list_of_ingredients: Mapped[str_256]
-    recipe_id: Mapped[int] = mapped_column(ForeignKey('recipes.id', ondelete='CASCADE'), nullable=False)
+    recipe_id: Mapped[int] = mapped_column(ForeignKey('recipes.id', ondelete='CASCADE'), nullable=False, index=True)
 
     recipe: Mapped['Recipe'] = relationship(
         back_populates="ingredients"
@@ -80,5 +92,8 @@ class Ingredient(Base):
     def to_json(self):
         """
         Метод для сериализации объекта в формат JSON.
+
+        Уже загруженные значения читаются напрямую из `__dict__`, незагруженные - через `getattr`.
         """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        loaded = self.__dict__
+        return {k: loaded[k] if k in loaded else getattr(self, k) for k in self._JSON_COLS}
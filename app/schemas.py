@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class RecipeCreate(BaseModel):
@@ -6,11 +6,31 @@ class RecipeCreate(BaseModel):
     Схема Pydantic для создания нового рецепта.
 
     Атрибуты:
-        name (str): Название рецепта. Обязательное поле.
+        name (str): Название рецепта. Обязательное поле, не более 256 символов.
         cooking_time (int): Время приготовления в минутах. Обязательное поле.
-        description (str): Описание рецепта. Обязательное поле.
+        description (str): Описание рецепта. Обязательное поле, не более 256 символов.
     """
+    name: str = Field(max_length=256)
+    cooking_time: int
+    description: str = Field(max_length=256)
+
+
+class RecipeOut(BaseModel):
+    """
+    Схема Pydantic для вывода рецепта.
+
+    Атрибуты:
+        id (int): Уникальный идентификатор рецепта.
+        name (str): Название рецепта.
+        views (int): Количество просмотров рецепта.
+        cooking_time (int): Время приготовления в минутах.
+        description (str): Описание рецепта.
+    """
+    model_config = {"from_attributes": True}
+
+    id: int
     name: str
+    views: int
     cooking_time: int
     description: str
 
@@ -20,15 +40,25 @@ class IngredientCreate(BaseModel):
     Схема Pydantic для добавления ингредиентов к существующему рецепту.
 
     Атрибуты:
-        name (str): Название ингредиента. Обязательное поле.
-        list_of_ingredients (str): Список ингредиентов в текстовом формате. Обязательное поле.
+        name (str): Название ингредиента. Обязательное поле, не более 256 символов.
+        list_of_ingredients (str): Список ингредиентов в текстовом формате. Обязательное поле, не более 256 символов.
         recipe_id (int): Идентификатор рецепта, к которому добавляется ингредиент. Обязательное поле.
     """
-    name: str
-    list_of_ingredients: str
+    name: str = Field(max_length=256)
+    list_of_ingredients: str = Field(max_length=256)
     recipe_id: int
 
 
+class IngredientsBulkCreated(BaseModel):
+    """
+    Схема Pydantic для ответа на массовую загрузку ингредиентов.
+
+    Атрибуты:
+        count (int): Количество загруженных ингредиентов. Обязательное поле.
+    """
+    count: int
+
+
 class RecipeDelete(BaseModel):
     """
     Схема Pydantic для ответа на запрос об удалении рецепта.
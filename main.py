@@ -1,47 +1,87 @@
-from sqlalchemy import delete, select
+from contextlib import asynccontextmanager
+
+from sqlalchemy import ARRAY, Integer, any_, bindparam, delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi import FastAPI, Depends, HTTPException
+from sqlalchemy.orm import load_only
+from fastapi import BackgroundTasks, FastAPI, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
 
-from app import models, schemas
+from app import inspect_cache, models, schemas
+from app.config import Config
 from app.database import engine, get_db
 
-app = FastAPI()
+inspect_cache.install()
 
 
-@app.on_event("startup")
-async def startup():
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """
-    Выполняется при старте приложения.
-    Создает все таблицы в базе данных, если они еще не существуют.
+    Управляет жизненным циклом приложения.
+
+    При старте создает все таблицы в базе данных, если они еще не существуют
+    и включен флаг `Config.AUTO_CREATE_SCHEMA`.
+    Инициализирует in-memory кэш для GET-эндпоинтов рецептов.
+    При завершении работы закрывает соединение с базой данных.
     """
-    async with engine.begin() as conn:
-        await conn.run_sync(models.Base.metadata.create_all)
+    FastAPICache.init(InMemoryBackend())
+    if Config.AUTO_CREATE_SCHEMA:
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
+    yield
+    await engine.dispose()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+RECIPES_CACHE_NAMESPACE = "recipes"
+RECIPES_CACHE_TTL = 2
+
+ASYNCPG_MAX_QUERY_ARGS = 32767
 
 
-@app.on_event("shutdown")
-async def shutdown():
+def recipes_cache_key(func, namespace: str = "", *, request: Request, **kwargs) -> str:
     """
-    Выполняется при завершении работы приложения.
-    Закрывает соединение с базой данных.
+    Строит ключ кэша по пути запроса.
+
+    Аргументы эндпоинта в ключ не входят: среди них есть сессия `db`,
+    которая на каждый запрос новая и сделала бы каждый ключ уникальным.
+    Строка запроса тоже не входит: эндпоинты рецептов не читают query-параметры,
+    а произвольные параметры создавали бы новые записи в кэше и обходили бы его.
     """
-    await engine.dispose()
+    return f"{namespace}:{request.url.path}"
 
 
-@app.get("/recipes", summary="Получить список всех рецептов")
+@app.get("/recipes", response_model=list[schemas.RecipeOut], summary="Получить список всех рецептов")
+@cache(expire=RECIPES_CACHE_TTL, namespace=RECIPES_CACHE_NAMESPACE, key_builder=recipes_cache_key)
 async def recipes(db: AsyncSession = Depends(get_db)):
     """
     Возвращает список всех рецептов, отсортированных по количеству просмотров (по убыванию)
     и времени приготовления (по возрастанию).
 
+    Выбираются только нужные столбцы, без создания ORM-объектов.
+
     :param db: Асинхронная сессия базы данных.
     :return: Список рецептов.
     """
-    query = select(models.Recipe).order_by(models.Recipe.views.desc(), models.Recipe.cooking_time.asc())
+    query = (
+        select(
+            models.Recipe.id,
+            models.Recipe.name,
+            models.Recipe.views,
+            models.Recipe.cooking_time,
+            models.Recipe.description,
+        )
+        .order_by(models.Recipe.views.desc(), models.Recipe.cooking_time.asc())
+    )
     res = await db.execute(query)
-    return res.scalars().all()
+    return [dict(r._mapping) for r in res.all()]
 
 
-@app.get("/recipes/{recipe_id}")
+@app.get("/recipes/{recipe_id}", response_model=schemas.RecipeOut)
+@cache(expire=RECIPES_CACHE_TTL, namespace=RECIPES_CACHE_NAMESPACE, key_builder=recipes_cache_key)
 async def recipe(recipe_id: int, db: AsyncSession = Depends(get_db)):
     """
     Возвращает рецепт по его ID.
@@ -51,26 +91,37 @@ async def recipe(recipe_id: int, db: AsyncSession = Depends(get_db)):
     :raises HTTPException: Если рецепт не найден, возвращает ошибку 404.
     :return: Рецепт.
     """
-    result = await db.execute(select(models.Recipe).filter_by(id=recipe_id))
-    recipe = result.scalars().first()
+    recipe = await db.get(models.Recipe, recipe_id)
     if recipe is None:
         raise HTTPException(status_code=404, detail="Recipe not found")
-    return recipe
+    return schemas.RecipeOut.model_validate(recipe)
 
 
 @app.post("/recipes", response_model=schemas.RecipeCreate, summary="Создать новый рецепт")
-async def create_recipe(recipe: schemas.RecipeCreate, db: AsyncSession = Depends(get_db)):
+async def create_recipe(
+    recipe: schemas.RecipeCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db)
+):
     """
     Создает новый рецепт и сохраняет его в базе данных.
 
+    Кэш рецептов очищается фоновой задачей, то есть уже после фиксации транзакции в `get_db`.
+
     :param recipe: Данные для создания нового рецепта (name, cooking_time, description).
+    :param background_tasks: Фоновые задачи, выполняемые после отправки ответа.
     :param db: Асинхронная сессия базы данных.
     :return: Созданный рецепт.
     """
-    db_recipe = models.Recipe(name=recipe.name, cooking_time=recipe.cooking_time, description=recipe.description)
+    db_recipe = models.Recipe(
+        name=recipe.name,
+        views=0,
+        cooking_time=recipe.cooking_time,
+        description=recipe.description
+    )
     db.add(db_recipe)
-    await db.commit()
-    await db.refresh(db_recipe)
+    await db.flush()
+    background_tasks.add_task(FastAPICache.clear, namespace=RECIPES_CACHE_NAMESPACE)
     return db_recipe
 
 
@@ -84,10 +135,13 @@ async def create_ingredient(ingredient: schemas.IngredientCreate, db: AsyncSessi
     :raises HTTPException: Если рецепт не найден, возвращает ошибку 404.
     :return: Созданный ингредиент.
     """
-    result = await db.execute(select(models.Recipe).filter_by(id=ingredient.recipe_id))
-    recipe = result.scalars().first()
+    recipe = await db.get(
+        models.Recipe,
+        ingredient.recipe_id,
+        options=[load_only(models.Recipe.cooking_time, models.Recipe.description)]
+    )
 
-    if not recipe:
+    if recipe is None:
         raise HTTPException(status_code=404, detail="Recipe not found")
 
     db_ingredient = models.Ingredient(
@@ -99,27 +153,143 @@ async def create_ingredient(ingredient: schemas.IngredientCreate, db: AsyncSessi
     )
 
     db.add(db_ingredient)
-    await db.commit()
-    await db.refresh(db_ingredient)
+    await db.flush()
     return db_ingredient
 
 
+async def _get_recipes_for(ingredients: list[schemas.IngredientCreate], db: AsyncSession) -> dict:
+    """
+    Загружает одним запросом время приготовления и описание всех рецептов,
+    на которые ссылаются ингредиенты.
+
+    :param ingredients: Список ингредиентов с ID рецептов.
+    :param db: Асинхронная сессия базы данных.
+    :raises HTTPException: Если хотя бы один рецепт не найден, возвращает ошибку 404.
+    :return: Словарь `{recipe_id: строка с cooking_time и description}`.
+    """
+    recipe_ids = {i.recipe_id for i in ingredients}
+    result = await db.execute(
+        select(models.Recipe.id, models.Recipe.cooking_time, models.Recipe.description)
+        .where(models.Recipe.id == any_(bindparam("recipe_ids", list(recipe_ids), type_=ARRAY(Integer))))
+    )
+    recipes = {row.id: row for row in result.all()}
+
+    missing = recipe_ids - recipes.keys()
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Recipes not found: {sorted(missing)}")
+    return recipes
+
+
+@app.post(
+    "/ingredients/batch",
+    response_model=list[schemas.IngredientCreate],
+    summary="Добавить несколько ингредиентов к рецептам за один запрос"
+)
+async def create_ingredients_batch(ingredients: list[schemas.IngredientCreate], db: AsyncSession = Depends(get_db)):
+    """
+    Добавляет сразу несколько ингредиентов многострочными INSERT.
+
+    Все рецепты проверяются одним SELECT с массивом ID (`= ANY(...)`), затем ингредиенты
+    вставляются запросами `INSERT ... VALUES (...), (...)`. Строки делятся на части так,
+    чтобы число параметров одного запроса не превышало лимит asyncpg (32767).
+    Все вставки фиксируются одним COMMIT.
+
+    :param ingredients: Список ингредиентов с ID рецептов, к которым они добавляются.
+    :param db: Асинхронная сессия базы данных.
+    :raises HTTPException: Если хотя бы один рецепт не найден, возвращает ошибку 404.
+    :return: Добавленные ингредиенты.
+    """
+    if not ingredients:
+        return []
+
+    recipes = await _get_recipes_for(ingredients, db)
+    rows = [
+        i.model_dump() | {
+            "cooking_time": recipes[i.recipe_id].cooking_time,
+            "description": recipes[i.recipe_id].description,
+        }
+        for i in ingredients
+    ]
+    chunk_size = ASYNCPG_MAX_QUERY_ARGS // len(rows[0])
+    for start in range(0, len(rows), chunk_size):
+        await db.execute(insert(models.Ingredient).values(rows[start:start + chunk_size]))
+    return ingredients
+
+
+@app.post(
+    "/ingredients/bulk",
+    response_model=schemas.IngredientsBulkCreated,
+    summary="Массовая загрузка ингредиентов через COPY"
+)
+async def create_ingredients_bulk(ingredients: list[schemas.IngredientCreate], db: AsyncSession = Depends(get_db)):
+    """
+    Загружает большое количество ингредиентов через бинарный протокол PostgreSQL COPY.
+
+    Строки передаются напрямую в asyncpg (`copy_records_to_table`), минуя компилятор INSERT SQLAlchemy.
+    Загрузка выполняется в транзакции текущей сессии: адаптер asyncpg открывает транзакцию
+    драйвера при первом запросе через сессию, которым здесь является SELECT в `_get_recipes_for`.
+
+    :param ingredients: Список ингредиентов с ID рецептов, к которым они добавляются.
+    :param db: Асинхронная сессия базы данных.
+    :raises HTTPException: Если хотя бы один рецепт не найден, возвращает ошибку 404.
+    :return: Количество загруженных ингредиентов.
+    """
+    if not ingredients:
+        return {"count": 0}
+
+    recipes = await _get_recipes_for(ingredients, db)
+    records = [
+        (
+            i.name,
+            recipes[i.recipe_id].cooking_time,
+            recipes[i.recipe_id].description,
+            i.list_of_ingredients,
+            i.recipe_id,
+        )
+        for i in ingredients
+    ]
+
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    # COPY идет напрямую в asyncpg, мимо SQLAlchemy. Без уже открытой транзакции драйвера
+    # он зафиксируется сразу и не откатится вместе с сессией, поэтому такой случай - ошибка.
+    if not raw.driver_connection.is_in_transaction():
+        raise RuntimeError("COPY must run inside the session transaction")
+    await raw.driver_connection.copy_records_to_table(
+        models.Ingredient.__tablename__,
+        records=records,
+        columns=["name", "cooking_time", "description", "list_of_ingredients", "recipe_id"],
+    )
+    return {"count": len(records)}
+
+
 @app.delete("/delete_recipe{recipe_id}", response_model=schemas.RecipeDelete, summary="Удалить рецепт по ID")
-async def delete_recipe(recipe_id: int, db: AsyncSession = Depends(get_db)):
+async def delete_recipe(recipe_id: int, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db)):
     """
     Удаляет рецепт по его ID.
 
+    Кэш рецептов очищается фоновой задачей, то есть уже после фиксации транзакции в `get_db`.
+
     :param recipe_id: Идентификатор рецепта, который нужно удалить.
+    :param background_tasks: Фоновые задачи, выполняемые после отправки ответа.
     :param db: Асинхронная сессия базы данных.
     :raises HTTPException: Если рецепт не найден, возвращает ошибку 404.
     :return: Сообщение об успешном удалении.
     """
-    db_recipe = await db.execute(select(models.Recipe).filter_by(id=recipe_id))
-    recipe = db_recipe.scalars().first()
-    if recipe is None:
+    result = await db.execute(
+        delete(models.Recipe)
+        .where(models.Recipe.id == recipe_id)
+        .returning(models.Recipe.id)
+    )
+    deleted = result.scalar_one_or_none()
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Recipe not found")
 
-    await db.execute(delete(models.Recipe).where(models.Recipe.id == recipe_id))
-    await db.commit()
-
+    background_tasks.add_task(FastAPICache.clear, namespace=RECIPES_CACHE_NAMESPACE)
     return {"message": f"Recipe with id {recipe_id} was successfully deleted."}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("main:app", loop="uvloop", http="httptools")
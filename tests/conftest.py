@@ -0,0 +1,83 @@
+import asyncio
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app import models
+from app.database import get_db
+from main import app
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+def _client_for(database_url):
+    """
+    Создает клиент FastAPI, у которого `get_db` подменен на сессию к базе `database_url`.
+    Перед тестом схема базы создается заново.
+    """
+    engine = create_async_engine(database_url, poolclass=NullPool)
+    test_session = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def create_schema():
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.drop_all)
+            await conn.run_sync(models.Base.metadata.create_all)
+
+    asyncio.run(create_schema())
+
+    async def override_get_db():
+        async with test_session() as session:
+            async with session.begin():
+                yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        # Хранилище InMemoryBackend общее на уровне класса, поэтому кэш сбрасывается для каждого теста.
+        InMemoryBackend._store.clear()
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client(tmp_path):
+    """
+    Клиент FastAPI, работающий с временной базой SQLite.
+    """
+    yield from _client_for(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+
+
+@pytest.fixture
+def pg_client():
+    """
+    Клиент FastAPI, работающий с PostgreSQL из переменной окружения `TEST_DATABASE_URL`.
+
+    Нужен для эндпоинтов, использующих возможности PostgreSQL и asyncpg (`= ANY(...)`, COPY).
+    Без переменной окружения тесты пропускаются.
+    """
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    yield from _client_for(TEST_DATABASE_URL)
+
+
+@pytest.fixture
+def count_ingredients(pg_client):
+    """
+    Возвращает функцию, считающую строки в таблице `ingredients` тестовой базы PostgreSQL.
+    """
+    def count():
+        async def run():
+            engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+            async with engine.connect() as conn:
+                result = await conn.scalar(select(func.count()).select_from(models.Ingredient))
+            await engine.dispose()
+            return result
+
+        return asyncio.run(run())
+
+    return count
@@ -0,0 +1,56 @@
+from fastapi_cache import FastAPICache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+CACHE_HEADER = "x-fastapi-cache"
+
+
+def test_repeated_get_is_served_from_cache(client):
+    assert client.get("/recipes").headers[CACHE_HEADER] == "MISS"
+    assert client.get("/recipes").headers[CACHE_HEADER] == "HIT"
+
+
+def test_query_string_does_not_change_cache_key(client):
+    assert client.get("/recipes").headers[CACHE_HEADER] == "MISS"
+    assert client.get("/recipes?junk=1").headers[CACHE_HEADER] == "HIT"
+    assert client.get("/recipes?junk=2").headers[CACHE_HEADER] == "HIT"
+
+
+def test_writes_clear_recipes_cache(client):
+    client.get("/recipes")
+
+    created = client.post("/recipes", json={"name": "Борщ", "cooking_time": 90, "description": "Суп"})
+    assert created.status_code == 200
+
+    response = client.get("/recipes")
+    assert response.headers[CACHE_HEADER] == "MISS"
+    assert [r["name"] for r in response.json()] == ["Борщ"]
+    assert client.get("/recipes").headers[CACHE_HEADER] == "HIT"
+
+    deleted = client.delete(f"/delete_recipe{response.json()[0]['id']}")
+    assert deleted.status_code == 200
+
+    response = client.get("/recipes")
+    assert response.headers[CACHE_HEADER] == "MISS"
+    assert response.json() == []
+
+
+def test_cache_is_cleared_after_commit(client, monkeypatch):
+    events = []
+    clear = FastAPICache.clear
+
+    async def recording_clear(*args, **kwargs):
+        events.append("clear")
+        return await clear(*args, **kwargs)
+
+    def on_commit(session):
+        events.append("commit")
+
+    monkeypatch.setattr(FastAPICache, "clear", recording_clear)
+    event.listen(Session, "after_commit", on_commit)
+    try:
+        client.post("/recipes", json={"name": "Борщ", "cooking_time": 90, "description": "Суп"})
+    finally:
+        event.remove(Session, "after_commit", on_commit)
+
+    assert events == ["commit", "clear"]
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.database import get_db
+from main import ASYNCPG_MAX_QUERY_ARGS, app
+from tests.conftest import TEST_DATABASE_URL
+
+
+@pytest.fixture
+def recipe_id(pg_client):
+    pg_client.post("/recipes", json={"name": "Борщ", "cooking_time": 90, "description": "Суп"})
+    return pg_client.get("/recipes").json()[0]["id"]
+
+
+def _ingredients(recipe_id, n):
+    return [{"name": f"Свекла {i}", "list_of_ingredients": "свекла", "recipe_id": recipe_id} for i in range(n)]
+
+
+def test_batch_inserts_all_ingredients(pg_client, recipe_id, count_ingredients):
+    response = pg_client.post("/ingredients/batch", json=_ingredients(recipe_id, 3))
+
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert count_ingredients() == 3
+
+
+def test_batch_above_asyncpg_parameter_limit(pg_client, recipe_id, count_ingredients):
+    n = ASYNCPG_MAX_QUERY_ARGS // 5 + 100
+
+    response = pg_client.post("/ingredients/batch", json=_ingredients(recipe_id, n))
+
+    assert response.status_code == 200
+    assert count_ingredients() == n
+
+
+def test_batch_with_unknown_recipe_writes_nothing(pg_client, recipe_id, count_ingredients):
+    payload = _ingredients(recipe_id, 2) + _ingredients(recipe_id + 1, 1)
+
+    response = pg_client.post("/ingredients/batch", json=payload)
+
+    assert response.status_code == 404
+    assert str(recipe_id + 1) in response.json()["detail"]
+    assert count_ingredients() == 0
+
+
+def test_bulk_copies_all_ingredients(pg_client, recipe_id, count_ingredients):
+    response = pg_client.post("/ingredients/bulk", json=_ingredients(recipe_id, 3))
+
+    assert response.status_code == 200
+    assert response.json() == {"count": 3}
+    assert count_ingredients() == 3
+
+
+def test_bulk_with_unknown_recipe_writes_nothing(pg_client, recipe_id, count_ingredients):
+    payload = _ingredients(recipe_id, 2) + _ingredients(recipe_id + 1, 1)
+
+    response = pg_client.post("/ingredients/bulk", json=payload)
+
+    assert response.status_code == 404
+    assert count_ingredients() == 0
+
+
+def test_bulk_copy_is_rolled_back_with_session(pg_client, recipe_id, count_ingredients):
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+
+    async def rolled_back_db():
+        async with AsyncSession(engine) as session:
+            async with session.begin() as transaction:
+                yield session
+                await transaction.rollback()
+
+    app.dependency_overrides[get_db] = rolled_back_db
+
+    response = pg_client.post("/ingredients/bulk", json=_ingredients(recipe_id, 3))
+
+    assert response.status_code == 200
+    assert count_ingredients() == 0
@@ -0,0 +1,25 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, load_only
+
+from app import models
+
+
+@pytest.mark.parametrize("model", [models.Recipe, models.Ingredient])
+def test_json_cols_match_table_columns(model):
+    assert model._JSON_COLS == tuple(model.__table__.columns.keys())
+
+
+def test_to_json_loads_deferred_columns():
+    engine = create_engine("sqlite://")
+    models.Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(models.Recipe(name="Борщ", views=3, cooking_time=90, description="Суп"))
+        session.commit()
+        session.expunge_all()
+
+        recipe = session.query(models.Recipe).options(load_only(models.Recipe.cooking_time)).one()
+
+        assert recipe.to_json() == {
+            "id": recipe.id, "name": "Борщ", "views": 3, "cooking_time": 90, "description": "Суп"
+        }